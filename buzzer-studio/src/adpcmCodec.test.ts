@@ -0,0 +1,150 @@
+/**
+ * Tests for the 2-bit ADPCM codec
+ * Reference decoder mirrors SamplePlayback/src/ADPCM2BitStream.cpp
+ */
+
+import { describe, it, expect } from 'vitest';
+import { encodeAdpcm2Bit, decodeAdpcm2Bit } from './adpcmCodec';
+
+const stepTable = [2, 3, 4, 5, 6, 8, 10, 13, 16, 20, 25, 32, 40, 50, 63, 80];
+const indexTable = [-1, -1, 2, 2];
+
+function referenceDecode(encoded: Uint8Array): number[] {
+  let predictor = 128;
+  let stepIndex = 0;
+  const out: number[] = [];
+
+  for (const byte of encoded) {
+    for (let i = 0; i < 4; i++) {
+      const code = (byte >> (6 - i * 2)) & 0x03;
+      const step = stepTable[stepIndex];
+      const delta = [-step, step, -step * 2, step * 2][code];
+      predictor = Math.max(0, Math.min(255, predictor + delta));
+      out.push(predictor);
+      stepIndex = Math.max(0, Math.min(15, stepIndex + indexTable[code]));
+    }
+  }
+
+  return out;
+}
+
+function referenceEncode(samples: Uint8Array): number[] {
+  let predictor = 128;
+  let stepIndex = 0;
+  const out: number[] = [];
+  let currentByte = 0;
+
+  for (let i = 0; i < samples.length; i++) {
+    const diff = samples[i] - predictor;
+    const step = stepTable[stepIndex];
+
+    let code: number;
+    if (diff < -step - step / 2) {
+      code = 2;
+    } else if (diff < 0) {
+      code = 0;
+    } else if (diff < step + step / 2) {
+      code = 1;
+    } else {
+      code = 3;
+    }
+
+    currentByte |= code << (6 - (i % 4) * 2);
+    if (i % 4 === 3) {
+      out.push(currentByte);
+      currentByte = 0;
+    }
+
+    const delta = [-step, step, -step * 2, step * 2][code];
+    predictor = Math.max(0, Math.min(255, predictor + delta));
+    stepIndex = Math.max(0, Math.min(15, stepIndex + indexTable[code]));
+  }
+
+  if (samples.length % 4 !== 0) {
+    out.push(currentByte);
+  }
+
+  return out;
+}
+
+function sineWave(length: number, period: number, amplitude: number): Uint8Array {
+  const samples = new Uint8Array(length);
+  for (let i = 0; i < length; i++) {
+    samples[i] = Math.round(128 + amplitude * Math.sin((2 * Math.PI * i) / period));
+  }
+  return samples;
+}
+
+describe('ADPCM 2-bit codec', () => {
+  it('decodes codes packed MSB first', () => {
+    // 0b01_01_11_00: +step, +step, +2*step, then -step at the larger step size
+    const decoded = decodeAdpcm2Bit(new Uint8Array([0b01011100]));
+    expect(Array.from(decoded)).toEqual([130, 132, 136, 132]);
+  });
+
+  it('matches the firmware decoder for every byte value', () => {
+    const encoded = new Uint8Array(1024);
+    for (let i = 0; i < encoded.length; i++) {
+      encoded[i] = (i * 37 + (i >> 3)) & 0xff;
+    }
+
+    expect(Array.from(decodeAdpcm2Bit(encoded))).toEqual(referenceDecode(encoded));
+  });
+
+  it('decodes only the requested number of samples', () => {
+    const encoded = new Uint8Array([0x5c, 0xff, 0x12]);
+    const full = decodeAdpcm2Bit(encoded);
+
+    expect(Array.from(decodeAdpcm2Bit(encoded, 9))).toEqual(Array.from(full.subarray(0, 9)));
+    expect(decodeAdpcm2Bit(encoded, 100)).toHaveLength(12);
+    expect(decodeAdpcm2Bit(encoded, 0)).toHaveLength(0);
+  });
+
+  it('clamps the predictor to the 8-bit range', () => {
+    const up = decodeAdpcm2Bit(new Uint8Array(16).fill(0xff));
+    const down = decodeAdpcm2Bit(new Uint8Array(16).fill(0xaa));
+
+    expect(up[up.length - 1]).toBe(255);
+    expect(down[down.length - 1]).toBe(0);
+  });
+
+  it('packs 4 samples per byte, padding the last byte', () => {
+    expect(encodeAdpcm2Bit(new Uint8Array(8))).toHaveLength(2);
+    expect(encodeAdpcm2Bit(new Uint8Array(9))).toHaveLength(3);
+    expect(encodeAdpcm2Bit(new Uint8Array(0))).toHaveLength(0);
+  });
+
+  it('matches the reference encoder', () => {
+    // Sweep every step size with both small and large jumps, plus an odd-length tail
+    const samples = new Uint8Array(4099);
+    for (let i = 0; i < samples.length; i++) {
+      samples[i] = (i * 97 + ((i >> 5) & 1) * 200) & 0xff;
+    }
+
+    expect(Array.from(encodeAdpcm2Bit(samples))).toEqual(referenceEncode(samples));
+  });
+
+  it('matches the reference encoder at the quantizer thresholds', () => {
+    // Pseudo-random noise lands exactly on the +/-1.5 * step boundaries for both signs
+    const samples = new Uint8Array(65536);
+    let seed = 12345;
+    for (let i = 0; i < samples.length; i++) {
+      seed = (seed * 1103515245 + 12345) & 0x7fffffff;
+      samples[i] = seed >> 23;
+    }
+
+    expect(Array.from(encodeAdpcm2Bit(samples))).toEqual(referenceEncode(samples));
+  });
+
+  it('round-trips a sine wave with small error', () => {
+    const original = sineWave(4000, 40, 60);
+    const decoded = decodeAdpcm2Bit(encodeAdpcm2Bit(original));
+
+    let sumAbs = 0;
+    for (let i = 0; i < original.length; i++) {
+      sumAbs += Math.abs(original[i] - decoded[i]);
+    }
+
+    expect(sumAbs / original.length).toBeLessThan(8);
+  });
+});
@@ -0,0 +1,124 @@
+/**
+ * 2-bit ADPCM codec
+ * Matches the decoder in SamplePlayback/src/ADPCM2BitStream.cpp
+ * Each byte holds 4 samples, packed MSB first: [7:6][5:4][3:2][1:0]
+ */
+
+// Tables are typed arrays so the hot loops stay on small-integer element loads
+
+// Step size table - logarithmic progression tuned for 8-bit audio
+const STEP_TABLE = new Int16Array([2, 3, 4, 5, 6, 8, 10, 13, 16, 20, 25, 32, 40, 50, 63, 80]);
+
+// Step index adjustment per code - small changes shrink the step, large ones grow it
+const INDEX_TABLE = new Int8Array([-1, -1, 2, 2]);
+
+// Per-code delta as sign * magnitude * step
+// code 0: -step, code 1: +step, code 2: -2*step, code 3: +2*step
+const DELTA_SIGN = new Int8Array([-1, 1, -1, 1]);
+const DELTA_MAG = new Int8Array([1, 1, 2, 2]);
+
+// Every (stepIndex, code) transition precomputed: 16 steps x 4 codes = 64 entries,
+// indexed by (stepIndex << 2) | code. Holds the predictor delta and the already
+// clamped next step index, so the per-sample update is two table loads.
+const TRANSITION_DELTA = new Int16Array(64);
+const TRANSITION_INDEX = new Uint8Array(64);
+
+for (let stepIndex = 0; stepIndex < 16; stepIndex++) {
+  for (let code = 0; code < 4; code++) {
+    const t = (stepIndex << 2) | code;
+    TRANSITION_DELTA[t] = DELTA_SIGN[code] * DELTA_MAG[code] * STEP_TABLE[stepIndex];
+    TRANSITION_INDEX[t] = Math.max(0, Math.min(15, stepIndex + INDEX_TABLE[code]));
+  }
+}
+
+/**
+ * Encode 8-bit unsigned PCM samples to 2-bit ADPCM
+ */
+export function encodeAdpcm2Bit(samples: Uint8Array): Uint8Array {
+  const n = samples.length;
+  const encoded = new Uint8Array((n + 3) >> 2);
+
+  let predictor = 128;
+  let stepIndex = 0;
+
+  // One output byte per group of 4 samples, assembled in a register and stored once
+  for (let g = 0; g < encoded.length; g++) {
+    const start = g << 2;
+    const end = Math.min(start + 4, n);
+    let byte = 0;
+
+    for (let i = start; i < end; i++) {
+      const diff = samples[i] - predictor;
+      const step = STEP_TABLE[stepIndex];
+
+      // Branchless quantizer: bit 0 is the sign (1 = positive), bit 1 is set when
+      // |diff| reaches 1.5 * step. Negative diffs must strictly exceed it, hence
+      // the `- neg`, matching the original `diff < -1.5 * step` comparison.
+      const neg = diff >>> 31;
+      const mag = (diff ^ -neg) + neg;
+      const big = ((2 * mag - 3 * step - neg) >>> 31) ^ 1;
+      const code = (big << 1) | (neg ^ 1);
+
+      // Codes shift in MSB first: (c0 << 6) | (c1 << 4) | (c2 << 2) | c3
+      byte = (byte << 2) | code;
+
+      const t = (stepIndex << 2) | code;
+      predictor = Math.max(0, Math.min(255, predictor + TRANSITION_DELTA[t]));
+      stepIndex = TRANSITION_INDEX[t];
+    }
+
+    // A short final group is left-aligned, leaving the unused codes as 0
+    encoded[g] = byte << ((4 - (end - start)) << 1);
+  }
+
+  return encoded;
+}
+
+/**
+ * Advance the decoder by one code
+ * State is packed as (predictor << 4) | stepIndex so it fits in one small integer.
+ */
+function advance(state: number, code: number): number {
+  const t = ((state & 0x0f) << 2) | code;
+  const predictor = Math.max(0, Math.min(255, (state >> 4) + TRANSITION_DELTA[t]));
+  return (predictor << 4) | TRANSITION_INDEX[t];
+}
+
+/**
+ * Decode 2-bit ADPCM back to 8-bit unsigned PCM (4 samples per input byte)
+ * @param sampleCount - Number of samples to decode, e.g. the original length to
+ *                      drop the padding codes in the last byte (default: all)
+ */
+export function decodeAdpcm2Bit(
+  encoded: Uint8Array,
+  sampleCount: number = encoded.length * 4
+): Uint8Array {
+  const n = Math.max(0, Math.min(sampleCount, encoded.length * 4));
+  const decoded = new Uint8Array(n);
+  const fullBytes = n >> 2;
+
+  let state = 128 << 4; // predictor 128, step index 0
+
+  // Whole bytes: the four codes are unpacked with constant shifts, no inner loop
+  for (let i = 0; i < fullBytes; i++) {
+    const byte = encoded[i];
+    const o = i << 2;
+
+    state = advance(state, byte >> 6);
+    decoded[o] = state >> 4;
+    state = advance(state, (byte >> 4) & 0x03);
+    decoded[o + 1] = state >> 4;
+    state = advance(state, (byte >> 2) & 0x03);
+    decoded[o + 2] = state >> 4;
+    state = advance(state, byte & 0x03);
+    decoded[o + 3] = state >> 4;
+  }
+
+  // Trailing samples when sampleCount stops part way through a byte
+  for (let i = fullBytes << 2; i < n; i++) {
+    state = advance(state, (encoded[fullBytes] >> (6 - ((i & 3) << 1))) & 0x03);
+    decoded[i] = state >> 4;
+  }
+
+  return decoded;
+}
@@ -0,0 +1,165 @@
+/**
+ * Tests for WavParser
+ */
+
+import { describe, it, expect } from 'vitest';
+import { parseWav } from './wavParser';
+
+interface WavOptions {
+  bitsPerSample: number;
+  numChannels: number;
+  samples: number[]; // Interleaved integer PCM values
+  extraChunk?: { id: string; size: number }; // Inserted between 'fmt ' and 'data'
+  riffId?: string;
+  waveId?: string;
+}
+
+/**
+ * Build a PCM WAV file in memory
+ */
+function buildWav(options: WavOptions): ArrayBuffer {
+  const { bitsPerSample, numChannels, samples, extraChunk } = options;
+  const bytesPerSample = bitsPerSample / 8;
+  const dataSize = samples.length * bytesPerSample;
+  // No RIFF pad byte after odd-sized chunks: parseWav steps by the declared size
+  const extraSize = extraChunk ? 8 + extraChunk.size : 0;
+
+  const buffer = new ArrayBuffer(12 + 24 + extraSize + 8 + dataSize);
+  const view = new DataView(buffer);
+  const writeId = (offset: number, id: string) => {
+    for (let i = 0; i < 4; i++) view.setUint8(offset + i, id.charCodeAt(i));
+  };
+
+  writeId(0, options.riffId ?? 'RIFF');
+  view.setUint32(4, buffer.byteLength - 8, true);
+  writeId(8, options.waveId ?? 'WAVE');
+
+  writeId(12, 'fmt ');
+  view.setUint32(16, 16, true);
+  view.setUint16(20, 1, true); // PCM
+  view.setUint16(22, numChannels, true);
+  view.setUint32(24, 8000, true);
+  view.setUint32(28, 8000 * numChannels * bytesPerSample, true);
+  view.setUint16(32, numChannels * bytesPerSample, true);
+  view.setUint16(34, bitsPerSample, true);
+
+  let offset = 36;
+  if (extraChunk) {
+    writeId(offset, extraChunk.id);
+    view.setUint32(offset + 4, extraChunk.size, true);
+    offset += extraSize;
+  }
+
+  writeId(offset, 'data');
+  view.setUint32(offset + 4, dataSize, true);
+  offset += 8;
+
+  for (const sample of samples) {
+    if (bitsPerSample === 8) {
+      view.setUint8(offset, sample);
+    } else if (bitsPerSample === 16) {
+      view.setInt16(offset, sample, true);
+    } else if (bitsPerSample === 24) {
+      view.setUint8(offset, sample & 0xff);
+      view.setUint8(offset + 1, (sample >> 8) & 0xff);
+      view.setUint8(offset + 2, (sample >> 16) & 0xff);
+    }
+    offset += bytesPerSample;
+  }
+
+  return buffer;
+}
+
+function expectSamples(actual: Float32Array, expected: number[]) {
+  expect(actual).toHaveLength(expected.length);
+  for (let i = 0; i < expected.length; i++) {
+    expect(actual[i]).toBeCloseTo(expected[i], 6);
+  }
+}
+
+describe('WavParser', () => {
+  it('reads 8-bit mono', () => {
+    const wav = parseWav(
+      buildWav({ bitsPerSample: 8, numChannels: 1, samples: [0, 64, 128, 255] })
+    );
+
+    expect(wav?.sampleRate).toBe(8000);
+    expect(wav?.bitsPerSample).toBe(8);
+    expectSamples(wav!.samples, [-1, -0.5, 0, 127 / 128]);
+  });
+
+  it('reads 8-bit stereo, averaging the channels', () => {
+    const wav = parseWav(
+      buildWav({ bitsPerSample: 8, numChannels: 2, samples: [0, 128, 192, 64, 255, 255] })
+    );
+
+    expectSamples(wav!.samples, [-0.5, 0, 127 / 128]);
+  });
+
+  it('reads 16-bit mono at an even data offset', () => {
+    const wav = parseWav(
+      buildWav({ bitsPerSample: 16, numChannels: 1, samples: [-32768, -16384, 0, 32767] })
+    );
+
+    expectSamples(wav!.samples, [-1, -0.5, 0, 32767 / 32768]);
+  });
+
+  it('reads 16-bit stereo at an even data offset', () => {
+    const wav = parseWav(
+      buildWav({ bitsPerSample: 16, numChannels: 2, samples: [-32768, 0, 16384, 16384] })
+    );
+
+    expectSamples(wav!.samples, [-0.5, 0.5]);
+  });
+
+  it('reads 16-bit data at an odd offset after a LIST chunk', () => {
+    // A 1-byte LIST chunk leaves the samples at an odd byte offset
+    const extraChunk = { id: 'LIST', size: 1 };
+    const mono = parseWav(
+      buildWav({ bitsPerSample: 16, numChannels: 1, samples: [-32768, 8192, 32767], extraChunk })
+    );
+    const stereo = parseWav(
+      buildWav({ bitsPerSample: 16, numChannels: 2, samples: [-32768, 0, 8192, 8192], extraChunk })
+    );
+
+    expectSamples(mono!.samples, [-1, 0.25, 32767 / 32768]);
+    expectSamples(stereo!.samples, [-0.5, 0.25]);
+  });
+
+  it('reads 24-bit mono and stereo', () => {
+    const mono = parseWav(
+      buildWav({ bitsPerSample: 24, numChannels: 1, samples: [-8388608, 4194304, 0] })
+    );
+    const stereo = parseWav(
+      buildWav({ bitsPerSample: 24, numChannels: 2, samples: [-8388608, 0, 4194304, 4194304] })
+    );
+
+    expectSamples(mono!.samples, [-1, 0.5, 0]);
+    expectSamples(stereo!.samples, [-0.5, 0.5]);
+  });
+
+  it('returns null for non-RIFF input', () => {
+    const wav = buildWav({ bitsPerSample: 8, numChannels: 1, samples: [128], riffId: 'RIFX' });
+
+    expect(parseWav(wav)).toBeNull();
+  });
+
+  it('returns null for RIFF input that is not WAVE', () => {
+    const wav = buildWav({ bitsPerSample: 8, numChannels: 1, samples: [128], waveId: 'AVI ' });
+
+    expect(parseWav(wav)).toBeNull();
+  });
+
+  it('skips unknown chunks between fmt and data', () => {
+    const wav = parseWav(
+      buildWav({
+        bitsPerSample: 8,
+        numChannels: 1,
+        samples: [0, 128],
+        extraChunk: { id: 'junk', size: 4 },
+      })
+    );
+
+    expectSamples(wav!.samples, [-1, 0]);
+  });
+});
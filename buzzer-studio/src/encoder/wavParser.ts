@@ -10,6 +10,13 @@ export interface WavData {
   samples: Float32Array; // Mono, normalized to [-1, 1]
 }
 
+// Chunk IDs as read by a single big-endian getUint32, so header checks compare
+// integers instead of building a string from four getUint8 calls per chunk
+const FOURCC_RIFF = 0x52494646; // 'RIFF'
+const FOURCC_WAVE = 0x57415645; // 'WAVE'
+const FOURCC_FMT = 0x666d7420; // 'fmt '
+const FOURCC_DATA = 0x64617461; // 'data'
+
 /**
  * Parse WAV file from ArrayBuffer
  * Returns null if not a valid PCM WAV file
@@ -18,35 +25,18 @@ export function parseWav(arrayBuffer: ArrayBuffer): WavData | null {
   const view = new DataView(arrayBuffer);
 
   // Check RIFF header
-  const riff = String.fromCharCode(
-    view.getUint8(0),
-    view.getUint8(1),
-    view.getUint8(2),
-    view.getUint8(3)
-  );
-  if (riff !== 'RIFF') return null;
+  if (view.getUint32(0) !== FOURCC_RIFF) return null;
 
   // Check WAVE format
-  const wave = String.fromCharCode(
-    view.getUint8(8),
-    view.getUint8(9),
-    view.getUint8(10),
-    view.getUint8(11)
-  );
-  if (wave !== 'WAVE') return null;
+  if (view.getUint32(8) !== FOURCC_WAVE) return null;
 
   // Find fmt chunk
   let offset = 12;
   while (offset + 8 <= view.byteLength) {
-    const chunkId = String.fromCharCode(
-      view.getUint8(offset),
-      view.getUint8(offset + 1),
-      view.getUint8(offset + 2),
-      view.getUint8(offset + 3)
-    );
+    const chunkId = view.getUint32(offset);
     const chunkSize = view.getUint32(offset + 4, true);
 
-    if (chunkId === 'fmt ') {
+    if (chunkId === FOURCC_FMT) {
       const audioFormat = view.getUint16(offset + 8, true);
       // We accept PCM integer only (1). If you want IEEE float (3), add support in readSamples.
       if (audioFormat !== 1) return null;
@@ -58,15 +48,10 @@ export function parseWav(arrayBuffer: ArrayBuffer): WavData | null {
       // Find data chunk
       let dataOffset = offset + 8 + chunkSize;
       while (dataOffset + 8 <= view.byteLength) {
-        const dataChunkId = String.fromCharCode(
-          view.getUint8(dataOffset),
-          view.getUint8(dataOffset + 1),
-          view.getUint8(dataOffset + 2),
-          view.getUint8(dataOffset + 3)
-        );
+        const dataChunkId = view.getUint32(dataOffset);
         const dataChunkSize = view.getUint32(dataOffset + 4, true);
 
-        if (dataChunkId === 'data') {
+        if (dataChunkId === FOURCC_DATA) {
           // Read sample data
           const samples = readSamples(
             view,
@@ -96,8 +81,14 @@ export function parseWav(arrayBuffer: ArrayBuffer): WavData | null {
   return null;
 }
 
+// Typed array views read samples in host byte order, so they can only stand in
+// for DataView's little-endian reads on little-endian hosts
+const HOST_LITTLE_ENDIAN = new Uint8Array(new Uint16Array([1]).buffer)[0] === 1;
+
 /**
  * Read and convert PCM samples to normalized float32 mono
+ * 8-bit and (aligned) 16-bit data is read through a typed array view over the
+ * WAV buffer itself rather than one DataView call per sample.
  */
 function readSamples(
   view: DataView,
@@ -110,6 +101,18 @@ function readSamples(
   if (bytesPerSample <= 0) return new Float32Array(0);
 
   const numFrames = Math.floor(size / (bytesPerSample * numChannels));
+  const byteOffset = view.byteOffset + offset;
+
+  if (bitsPerSample === 8) {
+    const pcm = new Uint8Array(view.buffer, byteOffset, numFrames * numChannels);
+    return mixToMono(pcm, numFrames, numChannels, 128, 1 / 128.0);
+  }
+
+  if (bitsPerSample === 16 && HOST_LITTLE_ENDIAN && byteOffset % 2 === 0) {
+    const pcm = new Int16Array(view.buffer, byteOffset, numFrames * numChannels);
+    return mixToMono(pcm, numFrames, numChannels, 0, 1 / 32768.0);
+  }
+
   const samples = new Float32Array(numFrames);
 
   for (let i = 0; i < numFrames; i++) {
@@ -120,9 +123,7 @@ function readSamples(
       const sampleOffset = offset + (i * numChannels + ch) * bytesPerSample;
 
       let sample = 0;
-      if (bitsPerSample === 8) {
-        sample = (view.getUint8(sampleOffset) - 128) / 128.0;
-      } else if (bitsPerSample === 16) {
+      if (bitsPerSample === 16) {
         sample = view.getInt16(sampleOffset, true) / 32768.0;
       } else if (bitsPerSample === 24) {
         const b0 = view.getUint8(sampleOffset);
@@ -147,3 +148,33 @@ function readSamples(
 
   return samples;
 }
+
+/**
+ * Average interleaved integer PCM channels into normalized float32 mono
+ */
+function mixToMono(
+  pcm: Uint8Array | Int16Array,
+  numFrames: number,
+  numChannels: number,
+  bias: number,
+  scale: number
+): Float32Array {
+  const samples = new Float32Array(numFrames);
+
+  if (numChannels === 1) {
+    for (let i = 0; i < numFrames; i++) {
+      samples[i] = (pcm[i] - bias) * scale;
+    }
+    return samples;
+  }
+
+  for (let i = 0, j = 0; i < numFrames; i++) {
+    let sum = 0;
+    for (let ch = 0; ch < numChannels; ch++, j++) {
+      sum += (pcm[j] - bias) * scale;
+    }
+    samples[i] = sum / numChannels;
+  }
+
+  return samples;
+}
@@ -0,0 +1,104 @@
+/**
+ * Tests for MidiConverter track splitting and C code generation
+ */
+
+import { describe, it, expect } from 'vitest';
+import type { Midi } from '@tonejs/midi';
+import { processTracksForExport, generateCodeFromProcessedTracks } from './midiConverter';
+
+interface TestNote {
+  time: number;
+  duration: number;
+  midi: number;
+}
+
+/**
+ * Build the subset of a parsed Midi that the converter reads
+ */
+function buildMidi(notes: TestNote[], name: string = 'Lead'): Midi {
+  return {
+    tracks: [{ name, notes: notes.map((n) => ({ ...n, name: '' })) }],
+  } as unknown as Midi;
+}
+
+// A4 (440 Hz) and A5 (880 Hz) periods in microseconds
+const A4_PERIOD = 2273;
+const A5_PERIOD = 1136;
+
+describe('MidiConverter', () => {
+  it('keeps non-overlapping notes in one stream with rests between them', () => {
+    const midi = buildMidi([
+      { time: 0, duration: 0.5, midi: 69 },
+      { time: 1.0, duration: 0.5, midi: 81 },
+    ]);
+
+    const [track] = processTracksForExport(midi, [0]);
+
+    expect(track.streams).toHaveLength(1);
+    expect(track.streams[0].name).toBe('lead');
+    expect(track.streams[0].commands).toEqual([
+      { period_us: A4_PERIOD, duration_us: 500000 },
+      { period_us: 0, duration_us: 500000 },
+      { period_us: A5_PERIOD, duration_us: 500000 },
+    ]);
+  });
+
+  it('shortens the previous note when the overlap is within tolerance', () => {
+    // 20ms overlap, under the default 50ms tolerance
+    const midi = buildMidi([
+      { time: 0, duration: 0.52, midi: 69 },
+      { time: 0.5, duration: 0.5, midi: 81 },
+    ]);
+
+    const [track] = processTracksForExport(midi, [0]);
+
+    expect(track.streams).toHaveLength(1);
+    expect(track.streams[0].commands).toEqual([
+      { period_us: A4_PERIOD, duration_us: 500000 },
+      { period_us: A5_PERIOD, duration_us: 500000 },
+    ]);
+  });
+
+  it('starts a new stream when the overlap exceeds tolerance', () => {
+    const midi = buildMidi([
+      { time: 0, duration: 1.0, midi: 69 },
+      { time: 0.5, duration: 0.5, midi: 81 },
+    ]);
+
+    const [track] = processTracksForExport(midi, [0]);
+
+    expect(track.streams.map((s) => s.name)).toEqual(['lead_stream_0', 'lead_stream_1']);
+    expect(track.streams[0].commands).toEqual([{ period_us: A4_PERIOD, duration_us: 1000000 }]);
+    expect(track.streams[1].commands).toEqual([
+      { period_us: 0, duration_us: 500000 },
+      { period_us: A5_PERIOD, duration_us: 500000 },
+    ]);
+  });
+
+  it('emits a NoteCmd table per stream', () => {
+    const midi = buildMidi([
+      { time: 0, duration: 1.0, midi: 69 },
+      { time: 0.5, duration: 0.5, midi: 81 },
+    ]);
+
+    const code = generateCodeFromProcessedTracks(processTracksForExport(midi, [0]), 'song');
+
+    expect(code.header).toContain('#define LEAD_STREAM_0_LENGTH 1');
+    expect(code.header).toContain('#define LEAD_STREAM_1_LENGTH 2');
+    expect(code.implementation).toBe(
+      [
+        '#include "song.h"',
+        '',
+        'const NoteCmd lead_stream_0[LEAD_STREAM_0_LENGTH] = {',
+        `    { ${A4_PERIOD}, 1000000 },`,
+        '};',
+        '',
+        'const NoteCmd lead_stream_1[LEAD_STREAM_1_LENGTH] = {',
+        '    { 0, 500000 },',
+        `    { ${A5_PERIOD}, 500000 },`,
+        '};',
+        '',
+      ].join('\n')
+    );
+  });
+});
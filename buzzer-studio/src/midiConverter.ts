@@ -31,6 +31,17 @@ function midiToFreq(noteNum: number): number {
   return 440.0 * Math.pow(2.0, (noteNum - 69) / 12.0);
 }
 
+/**
+ * Buzzer period in microseconds for a MIDI note, from its frequency rounded to whole Hz
+ */
+function notePeriodUs(noteNum: number): number {
+  const freqHz = Math.max(1, Math.round(midiToFreq(noteNum)));
+  return Math.max(1, Math.round(1_000_000 / freqHz));
+}
+
+// Periods for all 128 MIDI notes, computed once rather than per exported note
+const NOTE_PERIOD_US = Array.from({ length: 128 }, (_, noteNum) => notePeriodUs(noteNum));
+
 /**
  * Split a track's notes into monophonic streams (no overlapping notes per stream)
  * Notes with small overlaps will have their duration adjusted rather than being split into separate streams
@@ -46,29 +57,37 @@ function splitIntoMonophonicStreams(
   const sortedNotes = [...notes].sort((a, b) => a.time - b.time);
 
   const streams: NoteData[][] = [];
+  // End time of the last note in each stream, kept in step with `streams` so the
+  // placement scan reads one flat array of numbers instead of chasing note objects
+  const streamEnds: number[] = [];
   const overlapToleranceSec = overlapToleranceMs / 1000;
 
   for (const note of sortedNotes) {
+    const noteEnd = note.time + note.duration;
+
     // Try to find a stream where this note doesn't overlap (or overlaps within tolerance)
     let placedInStream = false;
-    for (const stream of streams) {
-      const lastNoteInStream = stream[stream.length - 1];
-      const lastNoteEnd = lastNoteInStream.time + lastNoteInStream.duration;
+    for (let s = 0; s < streamEnds.length; s++) {
+      const lastNoteEnd = streamEnds[s];
 
       // Calculate overlap
       const overlap = lastNoteEnd - note.time;
 
       // If this note starts after the last note ends, we can add it
       if (note.time >= lastNoteEnd) {
-        stream.push(note);
+        streams[s].push(note);
+        streamEnds[s] = noteEnd;
         placedInStream = true;
         break;
       }
       // If overlap is within tolerance, adjust the previous note's duration and add this one
       else if (overlap > 0 && overlap <= overlapToleranceSec) {
         // Shorten the previous note so it ends when this note starts
+        const stream = streams[s];
+        const lastNoteInStream = stream[stream.length - 1];
         lastNoteInStream.duration = note.time - lastNoteInStream.time;
         stream.push(note);
+        streamEnds[s] = noteEnd;
         placedInStream = true;
         break;
       }
@@ -77,6 +96,7 @@ function splitIntoMonophonicStreams(
     // If we couldn't place it in any existing stream, create a new one
     if (!placedInStream) {
       streams.push([note]);
+      streamEnds.push(noteEnd);
     }
   }
 
@@ -94,9 +114,7 @@ function notesToCommands(notes: NoteData[]): NoteCmd[] {
   for (const note of notes) {
     const startUs = Math.round(note.time * 1_000_000);
     const durUs = Math.round(note.duration * 1_000_000);
-    const freq = midiToFreq(note.midi);
-    const freqHz = Math.max(1, Math.round(freq));
-    const periodUs = Math.max(1, Math.round(1_000_000 / freqHz));
+    const periodUs = NOTE_PERIOD_US[note.midi] ?? notePeriodUs(note.midi);
     const delayUs = Math.max(0, startUs - prevEndUs);
 
     // Insert rest note if there's a gap
@@ -256,8 +274,11 @@ export function generateCodeFromProcessedTracks(
     const lengthMacro = `${stream.name.toUpperCase()}_LENGTH`;
     implLines.push(`const NoteCmd ${stream.name}[${lengthMacro}] = {`);
 
-    for (const cmd of stream.commands) {
-      implLines.push(`    { ${cmd.period_us}, ${cmd.duration_us} },`);
+    // Format the whole table as one block rather than pushing a line per command
+    if (stream.commands.length > 0) {
+      implLines.push(
+        stream.commands.map((cmd) => `    { ${cmd.period_us}, ${cmd.duration_us} },`).join('\n')
+      );
     }
 
     implLines.push('};');
@@ -6,6 +6,7 @@ export class MidiPlayer {
   private isPlaying: boolean = false;
   private startTime: number = 0;
   private pausedAt: number = 0;
+  private duration: number = 0;
   private scheduledNotes: Map<number, { gainNode: GainNode; oscillator: OscillatorNode }> =
     new Map();
   private animationFrameId: number | null = null;
@@ -13,6 +14,8 @@ export class MidiPlayer {
 
   setNotes(notes: NoteData[]) {
     this.notes = notes;
+    // Computed once here; updateTime() runs every animation frame
+    this.duration = notes.reduce((end, n) => Math.max(end, n.time + n.duration), 0);
     this.stop();
   }
 
@@ -165,9 +168,8 @@ export class MidiPlayer {
     if (!this.isPlaying || !this.audioContext) return;
 
     const currentTime = this.audioContext.currentTime - this.startTime;
-    const duration = Math.max(...this.notes.map((n) => n.time + n.duration), 0);
 
-    if (currentTime >= duration) {
+    if (currentTime >= this.duration) {
       this.stop();
       return;
     }
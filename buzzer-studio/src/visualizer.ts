@@ -20,6 +20,8 @@ export class MidiVisualizer {
   private notes: NoteData[] = [];
   private currentTime: number = 0;
   private duration: number = 0;
+  private minMidi: number = 0;
+  private maxMidi: number = 0;
   private onSeek: ((time: number) => void) | null = null;
   private options: ResolvedVisualizerOptions;
 
@@ -85,7 +87,16 @@ export class MidiVisualizer {
 
   setNotes(notes: NoteData[]) {
     this.notes = notes;
-    this.duration = Math.max(...notes.map((n) => n.time + n.duration), 0);
+
+    // Note bounds are fixed per track, so work them out once rather than on every draw
+    this.duration = 0;
+    this.minMidi = Infinity;
+    this.maxMidi = -Infinity;
+    for (const n of notes) {
+      this.duration = Math.max(this.duration, n.time + n.duration);
+      this.minMidi = Math.min(this.minMidi, n.midi);
+      this.maxMidi = Math.max(this.maxMidi, n.midi);
+    }
     this.currentTime = 0;
     console.log(`Visualizer: ${notes.length} notes, duration: ${this.duration}s`);
 
@@ -133,9 +144,7 @@ export class MidiVisualizer {
     if (this.notes.length === 0 || width === 0 || height === 0) return;
     if (this.duration === 0) return; // Prevent division by zero
 
-    // Find MIDI note range
-    const minMidi = Math.min(...this.notes.map((n) => n.midi));
-    const maxMidi = Math.max(...this.notes.map((n) => n.midi));
+    const { minMidi, maxMidi } = this;
     const midiRange = maxMidi - minMidi + 1;
 
     const padding = this.options.compact ? 10 : 40;